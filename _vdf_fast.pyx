@@ -0,0 +1,94 @@
+# cython: language_level=3
+"""
+Optional compiled VDF tokenizer for steam_sunshine_scanner.py
+
+Implements the same state machine as _parse_vdf_lines over a whole
+buffer. Normal scans don't use it: manifests are read with targeted
+regexes, so this only speeds up the full-parse fallback for manifests
+with an unusual layout. Build in place with:
+
+    cythonize -i _vdf_fast.pyx
+
+Numba isn't used here: it only speeds up numeric loops over arrays and
+doesn't compile code that builds str/dict objects like this parser.
+"""
+
+import re
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+
+# Escape sequences allowed inside quoted VDF strings
+_ESCAPE_RE = re.compile(rb'\\(["\\])')
+
+
+def parse_vdf_bytes(bytes data not None):
+    """Parse raw VDF bytes into nested dicts"""
+    cdef const char* buf = PyBytes_AS_STRING(data)
+    cdef Py_ssize_t n = PyBytes_GET_SIZE(data)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t end
+    cdef Py_ssize_t backslashes
+    cdef char c
+
+    result = {}
+    stack = [result]
+    current_key = None
+
+    while i < n:
+        c = buf[i]
+
+        if c == b'"':
+            # Find the closing quote on this line, skipping escaped ones
+            end = i + 1
+            backslashes = 0
+            while end < n and buf[end] != b'\n':
+                if buf[end] == b'"' and not backslashes % 2:
+                    break
+                if buf[end] == b'\\':
+                    backslashes += 1
+                else:
+                    backslashes = 0
+                end += 1
+
+            if end >= n or buf[end] != b'"':
+                # Unterminated string, drop the rest of the line
+                i = end + 1
+                continue
+
+            raw = buf[i + 1:end]
+            if b'\\' in raw:
+                raw = _ESCAPE_RE.sub(rb'\1', raw)
+            token = raw.decode('utf-8', 'ignore')
+            if current_key is None:
+                current_key = token
+            else:
+                # Key-value pair
+                stack[-1][current_key] = token
+                current_key = None
+            i = end + 1
+
+        elif c == b'{':
+            # Start of new section
+            if current_key is not None:
+                new_dict = {}
+                stack[-1][current_key] = new_dict
+                stack.append(new_dict)
+                current_key = None
+            i += 1
+
+        elif c == b'}':
+            # End of section
+            if len(stack) > 1:
+                stack.pop()
+            current_key = None
+            i += 1
+
+        elif c == b'/' and i + 1 < n and buf[i + 1] == b'/':
+            # Comment runs to end of line
+            while i < n and buf[i] != b'\n':
+                i += 1
+
+        else:
+            i += 1
+
+    return result
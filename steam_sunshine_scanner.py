@@ -5,85 +5,237 @@ Scans for installed Steam games and adds them to Apollo's apps list
 Apollo is a Sunshine fork with enhanced features including virtual display support
 """
 
+import atexit
+import functools
+import io
 import json
+import logging
 import os
 import re
 import sys
 import argparse
 import winreg
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional compiled tokenizer, built from _vdf_fast.pyx
+    from _vdf_fast import parse_vdf_bytes as _fast_parse_vdf_bytes
+except ImportError:
+    _fast_parse_vdf_bytes = None
+
+logger = logging.getLogger(__name__)
+
+_QUOTE = ord('"')
+_OPEN_BRACE = ord('{')
+_CLOSE_BRACE = ord('}')
+_SLASH = ord('/')
+_BACKSLASH = ord('\\')
+
+# A whole line holding a single "key" "value" pair
+_VDF_KV_RE = re.compile(rb'"((?:[^"\\]|\\.)*)"\s+"((?:[^"\\]|\\.)*)"')
+
+# Bump when the shape of cached manifest results changes
+_SCAN_CACHE_VERSION = 4
+
+# Library locations listed in libraryfolders.vdf
+_LIBRARY_PATH_RE = re.compile(rb'"path"\s+"([^"]+)"')
+
+# Escape sequences allowed inside quoted VDF strings
+_VDF_ESCAPE_RE = re.compile(rb'\\(["\\])')
+
+# Opening of the top-level block in appmanifest_*.acf files
+_APPSTATE_RE = re.compile(rb'^[ \t]*"AppState"\s*\{', re.M)
+
+# Fields read from the AppState block, each on its own line
+_MANIFEST_FIELD_RES = {
+    'appid': re.compile(rb'^[ \t]*"appid"[ \t]+"((?:[^"\\]|\\.)*)"', re.M),
+    'name': re.compile(rb'^[ \t]*"name"[ \t]+"((?:[^"\\]|\\.)*)"', re.M),
+    'installdir': re.compile(rb'^[ \t]*"installdir"[ \t]+"((?:[^"\\]|\\.)*)"', re.M),
+}
+_STATE_FLAGS_RE = re.compile(rb'^[ \t]*"StateFlags"[ \t]+"((?:[^"\\]|\\.)*)"', re.M)
+
+# Returned by SteamScanner.read_manifest when a manifest couldn't be read
+_READ_FAILED = object()
+
+# StateFlags bit set once an app is fully installed
+_STATE_FULLY_INSTALLED = 4
+
+
+def _enable_verbose_logging():
+    """Turn on this module's debug output
+    
+    Only this module's logger is raised to DEBUG. If the application
+    hasn't configured logging, a plain stdout handler is added so
+    verbose=True still prints something.
+    """
+    logger.setLevel(logging.DEBUG)
+    if not logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as indented JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _query_steam_path() -> str:
+    """Read SteamPath from the registry, cached for the life of the process"""
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam",
+                        0, winreg.KEY_READ) as key:
+        steam_path, _ = winreg.QueryValueEx(key, "SteamPath")
+    return steam_path.replace('/', '\\')
+
+
+def _vdf_unescape(token: bytes) -> str:
+    """Decode a quoted VDF token, resolving \\" and \\\\ escapes"""
+    if b'\\' in token:
+        token = _VDF_ESCAPE_RE.sub(rb'\1', token)
+    return token.decode('utf-8', 'ignore')
+
+
+def _parse_vdf_lines(lines: Iterable[bytes]) -> Dict:
+    """Parse VDF from an iterable of byte lines into nested dicts.
+
+    Lines that start with a quote are first tried against _VDF_KV_RE so
+    plain "key" "value" pairs are handled in one match. Everything else
+    (section names, braces, comments, odd layouts) falls through to a
+    tokenizer that walks quoted strings and braces directly. Lines are
+    consumed one at a time, so a file object can be passed in and streamed.
+    """
+    result = {}
+    stack = [result]
+    current_key = None
+    
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        
+        # Most lines are a plain "key" "value" pair, match those in one go
+        if current_key is None and line[0] == _QUOTE:
+            match = _VDF_KV_RE.fullmatch(line)
+            if match:
+                key, value = match.groups()
+                stack[-1][_vdf_unescape(key)] = _vdf_unescape(value)
+                continue
+        
+        i = 0
+        n = len(line)
+        
+        while i < n:
+            c = line[i]
+            
+            if c == _QUOTE:
+                # Find the closing quote, skipping escaped ones
+                end = line.find(b'"', i + 1)
+                while end != -1:
+                    backslashes = 0
+                    j = end - 1
+                    while j > i and line[j] == _BACKSLASH:
+                        backslashes += 1
+                        j -= 1
+                    if not backslashes % 2:
+                        break
+                    end = line.find(b'"', end + 1)
+                if end == -1:
+                    break
+                
+                token = _vdf_unescape(line[i + 1:end])
+                if current_key is None:
+                    current_key = token
+                else:
+                    # Key-value pair
+                    stack[-1][current_key] = token
+                    current_key = None
+                i = end + 1
+            
+            elif c == _OPEN_BRACE:
+                # Start of new section
+                if current_key is not None:
+                    new_dict = {}
+                    stack[-1][current_key] = new_dict
+                    stack.append(new_dict)
+                    current_key = None
+                i += 1
+            
+            elif c == _CLOSE_BRACE:
+                # End of section
+                if len(stack) > 1:
+                    stack.pop()
+                current_key = None
+                i += 1
+            
+            elif c == _SLASH and line.startswith(b'//', i):
+                # Comment runs to end of line
+                break
+            
+            else:
+                i += 1
+    
+    return result
+
+
+def _parse_vdf_bytes(data: bytes) -> Dict:
+    """Parse an in-memory VDF buffer, using the compiled tokenizer if built"""
+    if _fast_parse_vdf_bytes is not None:
+        return _fast_parse_vdf_bytes(data)
+    # Iterate lines lazily rather than building a list of them up front
+    return _parse_vdf_lines(io.BytesIO(data))
+
 
 class SteamScanner:
-    def __init__(self, custom_paths: Optional[List[str]] = None):
+    def __init__(self, custom_paths: Optional[List[str]] = None,
+                 cache_path: Optional[str] = None, use_cache: bool = True):
         self.steam_path = self.get_steam_path()
         self.library_folders = []
         self.custom_paths = custom_paths or []
+        self.cache_path = cache_path or os.path.join(
+            os.getenv('LOCALAPPDATA', os.path.expanduser('~')),
+            'ApolloSunshineGameFinder',
+            'scan_cache.json'
+        )
+        self.use_cache = use_cache
+        self.scan_cache = None
+        self._cache_save_registered = False
         
     def get_steam_path(self) -> Optional[str]:
         """Get Steam installation path from Windows registry"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                r"Software\Valve\Steam")
-            steam_path, _ = winreg.QueryValueEx(key, "SteamPath")
-            winreg.CloseKey(key)
-            return steam_path.replace('/', '\\')
+            return _query_steam_path()
         except Exception as e:
             print(f"Error finding Steam path: {e}")
             return None
     
     def parse_vdf(self, file_path: str) -> Dict:
         """Parse Valve Data File (VDF) format with improved parsing"""
-        result = {}
-        stack = [result]
-        current_key = None
-        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                # Split into lines for processing
-                lines = content.split('\n')
-                
-                for line in lines:
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('//'):
-                        continue
-                    
-                    # Check for opening brace (start of new section)
-                    if line == '{':
-                        if current_key and len(stack) > 0:
-                            new_dict = {}
-                            stack[-1][current_key] = new_dict
-                            stack.append(new_dict)
-                            current_key = None
-                        continue
-                    
-                    # Check for closing brace (end of section)
-                    if line == '}':
-                        if len(stack) > 1:
-                            stack.pop()
-                        continue
-                    
-                    # Parse key-value pairs
-                    # Pattern: "key"		"value"
-                    matches = re.findall(r'"([^"]*)"', line)
-                    
-                    if len(matches) == 2:
-                        # Key-value pair
-                        key, value = matches[0], matches[1]
-                        if len(stack) > 0:
-                            stack[-1][key] = value
-                    elif len(matches) == 1:
-                        # Just a key (section name)
-                        current_key = matches[0]
-                        
+            with open(file_path, 'rb', buffering=65536) as f:
+                if _fast_parse_vdf_bytes is not None:
+                    return _parse_vdf_bytes(f.read())
+                return _parse_vdf_lines(f)
         except Exception as e:
             print(f"Error parsing VDF {file_path}: {e}")
-        
-        return result
+            return {}
     
     def get_library_folders(self) -> List[str]:
         """Get all Steam library folders"""
@@ -104,87 +256,287 @@ class SteamScanner:
             folders.append(self.steam_path)
             vdf_path = os.path.join(self.steam_path, 'steamapps', 'libraryfolders.vdf')
             
-            if os.path.exists(vdf_path):
-                data = self.parse_vdf(vdf_path)
-                if 'libraryfolders' in data:
-                    for key, value in data['libraryfolders'].items():
-                        if isinstance(value, dict) and 'path' in value:
-                            folders.append(value['path'].replace('\\\\', '\\'))
+            # Only the "path" values are needed, so skip the full VDF parse.
+            # This isn't put in the scan cache: it's a single small file, and
+            # checking a cache entry would cost about as much as reading it.
+            try:
+                data = Path(vdf_path).read_bytes()
+                folders.extend(path.decode('utf-8', 'ignore').replace('\\\\', '\\')
+                               for path in _LIBRARY_PATH_RE.findall(data))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error reading {vdf_path}: {e}")
         
-        self.library_folders = folders
-        return folders
+        # The main Steam folder usually also appears in libraryfolders.vdf,
+        # so drop duplicates that differ only in case or separators
+        unique = {}
+        for folder in folders:
+            unique.setdefault(os.path.normcase(os.path.abspath(folder)), folder)
+        
+        self.library_folders = list(unique.values())
+        return self.library_folders
+    
+    @staticmethod
+    def _valid_cache_entry(cached, stamp: List) -> bool:
+        """Check a scan cache entry is a well-formed [mtime_ns, size, fields] for stamp"""
+        if not (isinstance(cached, list) and len(cached) == 3 and cached[:2] == stamp):
+            return False
+        fields = cached[2]
+        return fields is None or (isinstance(fields, dict) and
+                                  'appid' in fields and 'name' in fields)
+    
+    def load_scan_cache(self) -> Dict:
+        """Load cached manifest results from a previous run"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = _json_loads(f.read())
+            if data.get('version') == _SCAN_CACHE_VERSION:
+                manifests = data.get('manifests')
+                if isinstance(manifests, dict):
+                    return manifests
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable scan cache {self.cache_path}: {e}")
+        return {}
+    
+    def save_scan_cache(self):
+        """Write cached manifest results for the next run"""
+        if self.scan_cache is None:
+            return
+        
+        tmp_path = self.cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps({
+                    'version': _SCAN_CACHE_VERSION,
+                    'manifests': self.scan_cache
+                }))
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            print(f"Error saving scan cache: {e}")
     
     def scan_games(self, verbose: bool = False) -> List[Dict]:
         """Scan all library folders for installed games"""
-        games = []
+        manifests = []
+        
+        if verbose:
+            _enable_verbose_logging()
         
         if not self.library_folders:
             self.get_library_folders()
         
-        if verbose:
-            print("\n--- Detailed Scan ---")
+        logger.debug("\n--- Detailed Scan ---")
         
         for folder in self.library_folders:
             steamapps = os.path.join(folder, 'steamapps')
+            # Cache keys don't depend on how the library path was spelled
+            cache_prefix = os.path.normcase(os.path.abspath(steamapps))
             
-            if verbose:
-                print(f"\nChecking: {folder}")
-                print(f"  steamapps path: {steamapps}")
-                print(f"  exists: {os.path.exists(steamapps)}")
+            logger.debug("\nChecking: %s", folder)
+            logger.debug("  steamapps path: %s", steamapps)
             
-            if not os.path.exists(steamapps):
-                if verbose:
-                    print(f"  ✗ steamapps folder not found")
+            try:
+                it = os.scandir(steamapps)
+            except (FileNotFoundError, NotADirectoryError):
+                logger.debug("  ✗ steamapps folder not found")
                 continue
             
-            manifest_files = [f for f in os.listdir(steamapps) 
-                            if f.startswith('appmanifest_') and f.endswith('.acf')]
+            manifest_count = 0
+            with it:
+                for entry in it:
+                    if (entry.name.startswith('appmanifest_') and
+                            entry.name.endswith('.acf') and
+                            entry.is_file(follow_symlinks=False)):
+                        # DirEntry caches stat results, so this is free on Windows
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                            stamp = [st.st_mtime_ns, st.st_size]
+                        except OSError:
+                            stamp = None
+                        cache_key = os.path.join(cache_prefix, os.path.normcase(entry.name))
+                        manifests.append((entry.path, cache_key, stamp))
+                        manifest_count += 1
             
-            if verbose:
-                print(f"  Found {len(manifest_files)} manifest files")
+            logger.debug("  Found %d manifest files", manifest_count)
+        
+        if not manifests:
+            return []
+        
+        if self.use_cache and self.scan_cache is None:
+            self.scan_cache = self.load_scan_cache()
+        
+        # Reuse manifest fields that haven't changed since the last run.
+        # Verbose runs re-read everything so the per-manifest output is complete.
+        results = {}
+        to_parse = []
+        use_cached = self.scan_cache is not None and not verbose
+        for manifest_path, cache_key, stamp in manifests:
+            cached = self.scan_cache.get(cache_key) if use_cached else None
+            if stamp and self._valid_cache_entry(cached, stamp):
+                results[manifest_path] = cached[2]
+            else:
+                to_parse.append(manifest_path)
+        
+        if verbose:
+            if self.use_cache:
+                logger.debug("\n  Verbose scan, re-reading all manifests instead of using the scan cache")
             
-            for file in manifest_files:
-                manifest_path = os.path.join(steamapps, file)
-                if verbose:
-                    print(f"    Processing: {file}")
-                
-                game_info = self.parse_manifest(manifest_path, verbose=verbose)
-                if game_info:
-                    games.append(game_info)
-                    if verbose:
-                        print(f"      ✓ Added: {game_info['name']}")
-                elif verbose:
-                    print(f"      ✗ Failed to parse")
+            # Read serially so the per-manifest output stays readable
+            for manifest_path in to_parse:
+                logger.debug("\n    Processing: %s", manifest_path)
+                results[manifest_path] = self.read_manifest(manifest_path)
+        elif to_parse:
+            # Manifest reads are I/O bound, so overlap them across threads
+            with ThreadPoolExecutor(max_workers=min(32, len(to_parse))) as executor:
+                results.update(zip(to_parse, executor.map(self.read_manifest, to_parse)))
+        
+        if self.use_cache:
+            self.update_scan_cache(manifests, results)
+        
+        # Install state can change without the manifest changing (e.g. the game
+        # folder being deleted), so check it on every run, cached or not
+        logger.debug("\n  Install checks:")
+        
+        games = []
+        for manifest_path, _, _ in manifests:
+            game_info = self.installed_game(manifest_path, results[manifest_path])
+            if game_info:
+                games.append(game_info)
         
         return games
     
+    def update_scan_cache(self, manifests: List, results: Dict):
+        """Replace the cache with this scan's results and schedule it to be written at exit
+        
+        Only manifests seen in this scan are kept, so removed games and
+        libraries that are no longer scanned drop out of the cache.
+        """
+        self.scan_cache = {}
+        for manifest_path, cache_key, stamp in manifests:
+            result = results[manifest_path]
+            # Don't remember transient read errors, retry next run
+            if stamp and result is not _READ_FAILED:
+                self.scan_cache[cache_key] = stamp + [result]
+        
+        if not self._cache_save_registered:
+            atexit.register(self.save_scan_cache)
+            self._cache_save_registered = True
+    
+    def read_manifest_fields(self, data: bytes) -> Optional[Dict]:
+        """Extract appid, name, installdir and StateFlags from manifest bytes without a full parse
+        
+        Only AppState's own keys are searched. Steam writes them before any
+        nested section (UserConfig, InstalledDepots, ...), so the search
+        stops at the first nested '{' and same-named keys inside those
+        sections can't be picked up instead.
+        
+        Returns None if any of the required fields is missing so the
+        caller can fall back to the full VDF parser. StateFlags is only
+        included when present.
+        """
+        block = _APPSTATE_RE.search(data)
+        if not block:
+            return None
+        start = block.end()
+        end = data.find(b'{', start)
+        if end == -1:
+            end = len(data)
+        
+        fields = {}
+        for key, pattern in _MANIFEST_FIELD_RES.items():
+            match = pattern.search(data, start, end)
+            if not match:
+                return None
+            fields[key] = _vdf_unescape(match.group(1))
+        
+        match = _STATE_FLAGS_RE.search(data, start, end)
+        if match:
+            fields['StateFlags'] = _vdf_unescape(match.group(1))
+        
+        return fields
+    
     def parse_manifest(self, manifest_path: str, verbose: bool = False) -> Optional[Dict]:
         """Parse a Steam app manifest file"""
-        data = self.parse_vdf(manifest_path)
-        
         if verbose:
-            print(f"      Parsed data keys: {list(data.keys())}")
+            _enable_verbose_logging()
+        return self.installed_game(manifest_path, self.read_manifest(manifest_path))
+    
+    def read_manifest(self, manifest_path: str):
+        """Read the app fields from a manifest
         
-        if 'AppState' not in data:
-            if verbose:
-                print(f"      ✗ No 'AppState' key found")
-            return None
+        Returns a dict with appid, name, installdir and (if present)
+        StateFlags, None if the file isn't an app manifest, or
+        _READ_FAILED if it couldn't be read. Only the first two are
+        cached, so a transient read error is retried on the next run.
+        """
+        try:
+            data = Path(manifest_path).read_bytes()
+        except OSError as e:
+            print(f"Error reading manifest {manifest_path}: {e}")
+            return _READ_FAILED
+        
+        app_state = self.read_manifest_fields(data)
+        
+        if app_state is None:
+            # Unusual layout, fall back to the full VDF parser
+            parsed = _parse_vdf_bytes(data)
+            
+            logger.debug("      Parsed data keys: %s", list(parsed))
+            
+            if not isinstance(parsed.get('AppState'), dict):
+                logger.debug("      ✗ No 'AppState' key found")
+                return None
+            
+            app_state = parsed['AppState']
         
-        app_state = data['AppState']
         app_id = app_state.get('appid', '')
         name = app_state.get('name', 'Unknown')
         install_dir = app_state.get('installdir', '')
         
-        if verbose:
-            print(f"      App ID: {app_id}")
-            print(f"      Name: {name}")
-            print(f"      Install Dir: {install_dir}")
+        logger.debug("      App ID: %s", app_id)
+        logger.debug("      Name: %s", name)
+        logger.debug("      Install Dir: %s", install_dir)
+        
+        if not app_id or not name:
+            logger.debug("      ✗ Missing app_id or name")
+            return None
+        
+        fields = {'appid': app_id, 'name': name, 'installdir': install_dir}
+        if 'StateFlags' in app_state:
+            fields['StateFlags'] = app_state['StateFlags']
+        return fields
+    
+    def installed_game(self, manifest_path: str, fields) -> Optional[Dict]:
+        """Build the game entry for manifest fields if the app is actually installed"""
+        if not fields or fields is _READ_FAILED:
+            return None
         
+        name = fields.get('name')
+        app_id = fields.get('appid')
+        install_dir = fields.get('installdir', '')
         if not app_id or not name:
-            if verbose:
-                print(f"      ✗ Missing app_id or name")
             return None
         
+        # Manifests stay on disk while an app is uninstalled, updating or staged
+        state_flags = fields.get('StateFlags', '')
+        if (isinstance(state_flags, str) and state_flags.isdigit() and
+                not int(state_flags) & _STATE_FULLY_INSTALLED):
+            logger.debug("    ✗ %s: not fully installed (StateFlags %s)", name, state_flags)
+            return None
+        
+        if install_dir and not os.path.isdir(
+                os.path.join(os.path.dirname(manifest_path), 'common', install_dir)):
+            logger.debug("    ✗ %s: install folder missing", name)
+            return None
+        
+        logger.debug("    ✓ Installed: %s", name)
         return {
             'name': name,
             'app_id': app_id,
@@ -192,17 +544,27 @@ class SteamScanner:
             'exe_path': f'steam://rungameid/{app_id}'
         }
 
+# Fields shared by every app entry written to apps.json
+_APOLLO_APP_TEMPLATE = {
+    "name": "",
+    "output": "",
+    "cmd": "",
+    "detached": [],
+    "image-path": ""
+}
+
 class ApolloIntegration:
     """Integration for Apollo (Sunshine fork) with enhanced virtual display support"""
     
     def __init__(self, config_path: Optional[str] = None, verbose: bool = False):
         self.verbose = verbose
+        if verbose:
+            _enable_verbose_logging()
         if config_path:
             # If user provides a directory, append apps.json
             if os.path.isdir(config_path):
                 self.config_path = os.path.join(config_path, 'apps.json')
-                if self.verbose:
-                    print(f"Config path is a directory, using: {self.config_path}")
+                logger.debug("Config path is a directory, using: %s", self.config_path)
             else:
                 self.config_path = config_path
         else:
@@ -213,24 +575,22 @@ class ApolloIntegration:
                 'apps.json'
             )
         
-        if self.verbose:
-            print(f"\nApollo config path: {self.config_path}")
-            print(f"Config file exists: {os.path.exists(self.config_path)}")
+        logger.debug("\nApollo config path: %s", self.config_path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Config file exists: %s", os.path.exists(self.config_path))
     
     def load_apps(self) -> Dict:
         """Load existing Apollo apps configuration"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    if self.verbose:
-                        print(f"Loaded existing config with {len(config.get('apps', []))} apps")
-                    return config
+                with open(self.config_path, 'rb') as f:
+                    config = _json_loads(f.read())
+                logger.debug("Loaded existing config with %d apps", len(config.get('apps', [])))
+                return config
             except Exception as e:
                 print(f"Error loading config: {e}")
         else:
-            if self.verbose:
-                print("No existing config found, will create new one")
+            logger.debug("No existing config found, will create new one")
         
         return {"apps": []}
     
@@ -238,18 +598,38 @@ class ApolloIntegration:
         """Save Apollo apps configuration"""
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
         
+        # Write to a temp file and swap it in so a failed write can't
+        # leave a truncated apps.json behind
+        tmp_path = self.config_path + '.tmp'
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                f.write(_json_dumps(config))
+            os.replace(tmp_path, self.config_path)
             print(f"✓ Configuration saved to {self.config_path}")
             
-            if self.verbose:
-                print(f"Total apps in config: {len(config.get('apps', []))}")
+            logger.debug("Total apps in config: %d", len(config.get('apps', [])))
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             print(f"✗ Error saving config: {e}")
-            if self.verbose:
-                import traceback
-                traceback.print_exc()
+            logger.debug("Save failed", exc_info=True)
+    
+    def _make_app(self, game: Dict, enable_virtual_display: bool) -> Dict:
+        """Build an apps.json entry for a scanned game"""
+        app = {
+            **_APOLLO_APP_TEMPLATE,
+            "name": game['name'],
+            "detached": [game['exe_path']],
+        }
+        
+        # Apollo-specific: Enable virtual display for better resolution matching
+        # This utilizes Apollo's SudoVDA integration for automatic resolution/framerate matching
+        if enable_virtual_display:
+            app["virtual-display"] = True
+        
+        return app
     
     def add_games(self, games: List[Dict], enable_virtual_display: bool = True):
         """
@@ -265,35 +645,22 @@ class ApolloIntegration:
             config["apps"] = []
         
         existing_names = {app.get('name', '') for app in config['apps']}
-        added = 0
-        
-        if self.verbose:
-            print(f"\nExisting apps in config: {len(existing_names)}")
-            if existing_names:
-                print(f"Existing app names: {list(existing_names)[:5]}...")  # Show first 5
-        
-        for game in games:
-            if game['name'] not in existing_names:
-                apollo_app = {
-                    "name": game['name'],
-                    "output": "",
-                    "cmd": "",
-                    "detached": [game['exe_path']],
-                    "image-path": ""
-                }
-                
-                # Apollo-specific: Enable virtual display for better resolution matching
-                # This utilizes Apollo's SudoVDA integration for automatic resolution/framerate matching
-                if enable_virtual_display:
-                    apollo_app["virtual-display"] = True
-                
-                config['apps'].append(apollo_app)
-                added += 1
-                print(f"Added: {game['name']}" + 
-                      (" [Virtual Display Enabled]" if enable_virtual_display else ""))
-            else:
-                if self.verbose:
-                    print(f"Skipped (already exists): {game['name']}")
+        
+        logger.debug("\nExisting apps in config: %d", len(existing_names))
+        if existing_names and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Existing app names: %s...", list(islice(existing_names, 5)))  # Show first 5
+            for game in games:
+                if game['name'] in existing_names:
+                    logger.debug("Skipped (already exists): %s", game['name'])
+        
+        new_apps = [self._make_app(game, enable_virtual_display) for game in games
+                    if game['name'] not in existing_names]
+        config['apps'].extend(new_apps)
+        added = len(new_apps)
+        
+        if new_apps:
+            added_suffix = " [Virtual Display Enabled]" if enable_virtual_display else ""
+            sys.stdout.write("".join(f"Added: {app['name']}{added_suffix}\n" for app in new_apps))
         
         if added > 0:
             self.save_apps(config)
@@ -343,6 +710,12 @@ Examples:
         help='Disable Apollo virtual display feature for added games'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-read every app manifest instead of reusing results from the last scan'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -351,6 +724,10 @@ Examples:
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    if args.verbose:
+        _enable_verbose_logging()
+    
     print("="*60)
     print("Steam to Apollo Game Scanner")
     print("Apollo: Sunshine fork with Virtual Display support")
@@ -358,7 +735,7 @@ Examples:
     print()
     
     # Scan for Steam games
-    scanner = SteamScanner(custom_paths=args.steam_path)
+    scanner = SteamScanner(custom_paths=args.steam_path, use_cache=not args.no_cache)
     
     if not args.steam_path and not scanner.steam_path:
         print("Error: Could not find Steam installation")